@@ -80,14 +80,19 @@ import os
 from threading import RLock
 from pathlib import Path
 import csv
-import pprint
 from shutil import rmtree
-from typing import Any, List, Dict, Tuple, Callable
+from typing import Any, List, Dict, Tuple, Callable, Iterable, Iterator, Set
+from collections import defaultdict, OrderedDict
 import logging
-from io import IOBase
+from io import StringIO
 import re
+import hashlib
+import locale
+import time
+from functools import lru_cache
+from contextlib import contextmanager
 
-from talon import Context, registry, app, Module, settings, actions, fs
+from talon import Context, registry, app, Module, settings, actions, fs, cron
 
 class LoadError(Exception):
     pass
@@ -98,6 +103,26 @@ class ItemCountError(Exception):
 class FilenameError(Exception):
     pass
 
+# control file actions which read key,value pairs from the auxiliary file
+_ADD_OR_REPLACE = frozenset({'ADD', 'REPLACE'})
+
+class _AuxiliaryFileDialect(csv.excel):
+    """CSV dialect for auxiliary config files, which allow backslash-escaped commas."""
+    escapechar = '\\'
+
+class _ControlFileDialect(csv.excel):
+    """CSV dialect for control files, which contain (windows) paths and so have no escape character."""
+    escapechar = None
+
+# config file dialects, by escape character
+_csv_dialects = { '\\': _AuxiliaryFileDialect, None: _ControlFileDialect }
+
+# patterns for picking apart .talon files: the '-' line ending the context header, comment lines
+# in the header and tag() calls in the body (whole lines, including the newline).
+_talon_header_end = re.compile(r'^-', re.MULTILINE)
+_talon_comment_line = re.compile(r'^[^\S\n]*#.*\n?', re.MULTILINE)
+_talon_tag_call_line = re.compile(r'^[^\S\n]*tag\(\):.*\n?', re.MULTILINE)
+
 # enable/disable debug messages
 # testing = False
 
@@ -127,6 +152,17 @@ monitor_registry_for_updates = True
 # monitor_filesystem_for_updates = not monitor_registry_for_updates
 monitor_filesystem_for_updates = False
 
+# Talon reports several file system events for a single change, so events are held for this
+# long and then processed together.
+update_delay = '100ms'
+# ...but a steady stream of events must not hold them back forever, so once the first of them has
+# been waiting this long (in seconds), the timer is no longer restarted.
+update_max_delay = 0.5
+
+# minimum number of paths whose modification times are remembered, least recently used are dropped first
+# (the table may grow beyond this to cover all watched paths)
+updated_paths_limit = 1024
+
 @mod.action_class
 class PersonalizationActions:
     """
@@ -134,8 +170,46 @@ class PersonalizationActions:
     """
     def reload_personalizations() -> None:
         "Regenerate personalized contexts from source files."
-        personalizer.unload_personalizations()
-        personalizer.load_personalizations()
+        if personalizer is None:
+            # Talon is not ready yet, personalizations will be loaded when it is
+            return
+        personalizer.reload_personalizations()
+
+@lru_cache(maxsize=512)
+def _realpath(path: str) -> str:
+    """Cached version of os.path.realpath(), for paths that are resolved repeatedly."""
+    return os.path.realpath(path)
+
+@lru_cache(maxsize=1024)
+def _path_key(path: str) -> str:
+    """Returns the normalized form of given path, so that spellings which differ only in case (on Windows)
+    or in redundant separators refer to the same entry when used as a key."""
+    return os.path.normcase(os.path.normpath(path))
+
+@lru_cache(maxsize=1024)
+def _context_path_for_file(path_in: str, talon_user: str) -> str:
+    """Returns Talon context path corresponding to given path, relative to the given talon user folder."""
+    # plain string operations throughout, no Path objects
+    path = os.path.normpath(path_in)
+    if os.path.isabs(path):
+        # compare normalized forms, like Path.is_relative_to() does on Windows (where case doesn't matter)
+        if not _path_key(path).startswith(os.path.join(_path_key(talon_user), '')):
+            raise ValueError(f'_get_context_from_path: given path is not relative to Talon user folder: {path_in}')
+    else:
+        # assume path is relative to talon user folder
+        path = os.path.join(talon_user, path)
+
+    # relpath() accepts Path or str, returns str
+    temp = os.path.relpath(path, talon_user)
+
+    _, extension = os.path.splitext(path)
+    if not extension == '.talon':
+        # remove the file extension. splitext() returns str
+        temp, _ = os.path.splitext(temp)
+    ctx_path = temp.replace(os.path.sep, '.')
+
+    # this will need to change if we ever want to override any context not under 'user.'.
+    return 'user.' + ctx_path
 
 def makedirs(path: str, mode: int, exist_ok: bool) -> None:
     # https://stackoverflow.com/questions/5231901/permission-problems-when-creating-a-dir-with-os-makedirs-in-python
@@ -152,6 +226,9 @@ class Personalizer():
 
     class PersonalContext():
         """A personalized Talon context."""
+
+        # one of these is created per personalized context, so skip the per-instance dict
+        __slots__ = ('personalizer', 'ctx_path', '_testing', 'settings_map', 'refresh_map', 'source_match_string', '_source_file_path')
         
         def __init__(self, ctx_path: str, personalizer: Any, settings_map: Dict):
             if not ctx_path in registry.contexts:
@@ -162,6 +239,9 @@ class Personalizer():
 
             self.ctx_path = ctx_path
 
+            # computed on first use, see get_source_file_path()
+            self._source_file_path = None
+
             self._testing = None
 
             self.settings_map = settings_map
@@ -191,6 +271,13 @@ class Personalizer():
             else:
                 self.personalizer._update_all_settings(self, caller_id)
 
+        def get_source_file_path(self) -> Path:
+            """Return the path of the source file for this context."""
+            # this is needed repeatedly (load, watch, write, unload) and never changes for a given context
+            if self._source_file_path is None:
+                self._source_file_path = self._find_source_file_path()
+            return self._source_file_path
+
         def _personalize_match_string(self, tag: str) -> str:
             """Internal function to add personalization tag to the context match string."""
 
@@ -208,6 +295,8 @@ class Personalizer():
     class PersonalListContext(PersonalContext):
         """A personalized Talon list context."""
 
+        __slots__ = ('lists', 'source_context')
+
         def __init__(self, ctx_path: str, personalizer: Any, settings_map: Dict):
             super().__init__(ctx_path, personalizer, settings_map)
 
@@ -224,48 +313,51 @@ class Personalizer():
                     raise ValueError(f'get_list: no such list: {list_name}')
 
                 if self.testing:
-                   logging.debug(f'Personalizer.PersonalListContext.get_list: loaded list from registry: {list_name} = {self.lists[list_name]}')
+                   logging.debug('Personalizer.PersonalListContext.get_list: loaded list from registry: %s = %s', list_name, self.lists[list_name])
 
             return self.lists[list_name]
-                    
+
+        def set_list(self, list_name: str, value: Dict[str, str]) -> None:
+            """Replace the personalized contents of the given list."""
+            if not list_name in registry.lists:
+                raise ValueError(f'set_list: no such list: {list_name}')
+
+            self.lists[list_name] = value
+
         def remove(self, list_name: str) -> None:
             try:
                 del self.lists[list_name]
             except KeyError as e:
                 raise ValueError(f'remove: no such list: {list_name}')
                 
-        def write(self, file_path: str, tag: str, header: str) -> None:
-            """Generate one personalized file"""
-
-            # logging.debug(f'Personalizer.PersonalListContext.write: {ctx_path=}, {new_match_string=}')
-
-            if self.testing:
-                logging.debug(f'Personalizer.PersonalListContext.write: writing list customizations to "{file_path}"...')
-                
-            with open(file_path, 'w') as f:
-                self._write_py_header(f, header)
-                self._write_py_context(f, tag)
-                pp = pprint.PrettyPrinter(indent=4)
-                for list_name, list_value in self.lists.items():
-                    print(f'ctx.lists["{list_name}"] = {pp.pformat(list_value)}\n', file=f)
-
-        def _write_py_header(self, f: IOBase, header: str) -> None:
-            """Internal method for writing header to Talon python file."""
-            print(header, file=f)
-
-        def _write_py_context(self, f: IOBase, tag: str) -> None:
-            """Internal method for writing context definition to Talon python file."""
-            print('from talon import Context', file=f)
-            print('ctx = Context()', file=f)
-            
+        def get_file_content(self, tag: str, header: str) -> str:
+            """Return the contents of the personalized file."""
+            # logging.debug(f'Personalizer.PersonalListContext.get_file_content: {self.ctx_path=}, {tag=}')
+            parts = [self._format_py_header(header), self._format_py_context(tag)]
+            for list_name, list_value in self.lists.items():
+                parts.append(self._format_py_list(list_name, list_value))
+            return ''.join(parts)
+
+        def _format_py_header(self, header: str) -> str:
+            """Internal method for formatting header of Talon python file."""
+            return f'{header}\n'
+
+        def _format_py_list(self, list_name: str, list_value: Dict[str, str]) -> str:
+            """Internal method for formatting one list definition for Talon python file, one entry per line."""
+            # the lists are flat str -> str maps, so there is no need for pprint's recursive formatting
+            entries = ''.join([f'    {key!r}: {value!r},\n' for key, value in list_value.items()])
+            return f'ctx.lists["{list_name}"] = {{\n{entries}}}\n\n'
+
+        def _format_py_context(self, tag: str) -> str:
+            """Internal method for formatting context definition for Talon python file."""
             new_match_string = self._personalize_match_string(tag)
-            print(f'ctx.matches = """{new_match_string}"""\n', file=f)
+            return f'from talon import Context\nctx = Context()\nctx.matches = """{new_match_string}"""\n\n'
 
-        def get_source_file_path(self) -> str:
+        def _find_source_file_path(self) -> Path:
             """Function for extracting filesystem path information from the context path string."""
             
             if not self.ctx_path.startswith('user.'):
-                raise ValueError('get_source_file_path: can only handle user-defined contexts (ctx_path)')
+                raise ValueError('_find_source_file_path: can only handle user-defined contexts (ctx_path)')
                 
             # if self.testing:
             #    logging.debug(f'Personalizer.PersonalListContext.get_source_file_path: {ctx_path=}')
@@ -280,21 +372,22 @@ class Personalizer():
             user_path = parent_path.with_suffix('.py')
             
             if self.testing:
-                logging.debug(f'Personalizer.PersonalListContext.PersonalListContext.get_source_file_path: returning {user_path=}')
+                logging.debug('Personalizer.PersonalListContext._find_source_file_path: returning user_path=%r', user_path)
             
             return user_path
 
     class PersonalCommandContext(PersonalContext):
         """A personalized Talon command context."""
+
+        __slots__ = ('_source_commands', '_overrides', 'tag_calls')
         
         def __init__(self, ctx_path: str, personalizer: Any, settings_map: Dict):
             super().__init__(ctx_path, personalizer, settings_map)
 
-            if self.testing:
-                   logging.debug(f'Personalizer.PersonalCommandContext.__init__: loading commands from registry for context {ctx_path}')
-
-            # need to copy this way to avoid KeyErrors (in current Talon versions)
-            self.commands = {v.rule.rule:v.target.code for k,v in registry.contexts[self.ctx_path].commands.items()}
+            # the source commands are not copied up front, we just keep track of the changes and
+            # overlay them on the registry commands when the personalized file is written.
+            self._source_commands = registry.contexts[self.ctx_path].commands
+            self._overrides: Dict[str, str] = {}
 
             # fetch additional information
             self.source_match_string = self.tag_calls = None
@@ -306,84 +399,95 @@ class Personalizer():
             
             # logging.debug(f'Personalizer.PersonalCommandContext._parse_talon_file: {self.ctx_path=}, {path}')
             
+            with open(path, 'r') as f:
+                text = f.read()
+
             source_match_string = ''
             tag_calls = []
-            with open(path, 'r') as f:
-                seen_dash = False
-                for line in f:
-                    if seen_dash:
-                        if line.strip().startswith('tag():'):
-                            # filter out personalization tag here, or error...?
-                            tag_calls.append(line)
-                    else:
-                        if line.startswith('-'):
-                            seen_dash = True
-                        elif line.lstrip().startswith('#'):
-                            continue
-                        else:
-                            # logging.debug(f'Personalizer.PersonalCommandContext._parse_talon_file: found context match line: {line}')
-                            source_match_string += line
-                if not seen_dash:
-                    # never found a '-' => no context header for this file
-                    source_match_string = ''
+            header_end = _talon_header_end.search(text)
+            if header_end:
+                # logging.debug(f'Personalizer.PersonalCommandContext._parse_talon_file: found context header: {text[:header_end.start()]}')
+                source_match_string = _talon_comment_line.sub('', text[:header_end.start()])
+                # filter out personalization tag here, or error...?
+                tag_calls = _talon_tag_call_line.findall(text, header_end.end())
+            # else: never found a '-' => no context header for this file
             
             # logging.debug(f'Personalizer.PersonalCommandContext._parse_talon_file: for {ctx_path}, returning {source_match_string=}, {tag_calls=}')
             
             self.source_match_string = source_match_string
             self.tag_calls = tag_calls
 
+        @property
+        def commands(self) -> Dict[str, str]:
+            """Personalized commands for this context, i.e. the source commands with local changes applied."""
+            return dict(self._iter_commands())
+
+        def _iter_commands(self) -> Iterator[Tuple[str, str]]:
+            """Internal generator yielding (rule, implementation) pairs for the personalized commands."""
+            overrides = self._overrides
+            source_rules = set()
+            # need to read this way to avoid KeyErrors (in current Talon versions)
+            for k, v in self._source_commands.items():
+                rule = v.rule.rule
+                source_rules.add(rule)
+                yield rule, overrides.get(rule, v.target.code)
+
+            # added commands go after the source commands
+            for rule, impl in overrides.items():
+                if not rule in source_rules:
+                    yield rule, impl
+
         def remove(self, command_key: str) -> None:
-            try:
-                # del commands[command_key]
-                self.commands[command_key] = 'skip()'
-            except KeyError as e:
-                raise ValueError(f'remove: no such command: {command_key}')
+            # del commands[command_key]
+            self._overrides[command_key] = 'skip()'
                 
         def replace(self, command_key: str, new_value: str) -> None:
-            try:
-                self.commands[command_key] = new_value
-            except KeyError as e:
-                raise ValueError(f'remove: no such command: {command_key}')
-
-        def write(self, file_path: str, tag: str, header: str) -> None:
-            """Generate one personalized file"""
-
-            if self.testing:
-                logging.debug(f'Personalizer.PersonalCommandContext.write: writing command customizations to "{file_path}"...')
-                
-            with open(file_path, 'w') as f:
-                self._write_talon_header(f, header)
-                    
-                self._write_talon_context(f, tag)
-                    
-                self._write_talon_tag_calls(f)
-                    
-                # logging.debug(f'Personalizer.PersonalCommandContext.write: {write=}')
-                for personal_command, personal_impl in self.commands.items():
-                    print(f'{personal_command}:', file=f)
-                    for line in personal_impl.split('\n'):
-                        print(f'\t{line}', file=f)
-
-        def _write_talon_header(self, f: IOBase, header: str) -> None:
-            """Internal method for writing header to .talon file."""
-            print(header, file=f)
-
-        def _write_talon_context(self, f: IOBase, tag: str) -> None:
-            """Internal method for writing context definition to .talon file."""
+            self._overrides[command_key] = new_value
+
+        def bulk_remove(self, command_keys: Iterable[str]) -> None:
+            """Remove several commands at once, in the given order."""
+            self._overrides.update(dict.fromkeys(command_keys, 'skip()'))
+
+        def bulk_replace(self, changes: Dict[str, str]) -> None:
+            """Apply several command changes at once, given as a map of command to new implementation."""
+            self._overrides.update(changes)
+
+        def get_file_content(self, tag: str, header: str) -> str:
+            """Return the contents of the personalized file."""
+            parts = [
+                self._format_talon_header(header),
+                self._format_talon_context(tag),
+                self._format_talon_tag_calls(),
+            ]
+            # logging.debug(f'Personalizer.PersonalCommandContext.get_file_content: {parts=}')
+            parts.extend(self._format_talon_commands())
+            return ''.join(parts)
+
+        def _format_talon_commands(self) -> Iterator[str]:
+            """Internal generator formatting command definitions for .talon file."""
+            for personal_command, personal_impl in self._iter_commands():
+                yield f'{personal_command}:\n'
+                for line in personal_impl.split('\n'):
+                    yield f'\t{line}\n'
+
+        def _format_talon_header(self, header: str) -> str:
+            """Internal method for formatting header of .talon file."""
+            return f'{header}\n'
+
+        def _format_talon_context(self, tag: str) -> str:
+            """Internal method for formatting context definition for .talon file."""
             new_match_string = self._personalize_match_string(tag)
-            print(f'{new_match_string}\n-', file=f)
+            return f'{new_match_string}\n-\n'
             
-        def _write_talon_tag_calls(self, f: IOBase) -> None:
-            """Internal method for writing tag calls to .talon file."""
-            for line in self.tag_calls:
-                print(line, file=f, end='')
-            print(file=f)
+        def _format_talon_tag_calls(self) -> str:
+            """Internal method for formatting tag calls for .talon file."""
+            return ''.join(self.tag_calls) + '\n'
 
-        def get_source_file_path(self) -> str:
+        def _find_source_file_path(self) -> Path:
             """Function for extracting filesystem path information from the context path string."""
             
             if not self.ctx_path.startswith('user.'):
-                raise ValueError('get_source_file_path: can only handle user-defined contexts (ctx_path)')
+                raise ValueError('_find_source_file_path: can only handle user-defined contexts (ctx_path)')
                 
             # if self.testing:
             #    logging.debug(f'Personalizer.PersonalCommandContext.split_context_to_user_path_and_file_name: {ctx_path=}')
@@ -400,7 +504,7 @@ class Personalizer():
             user_path = parent_path.with_suffix('.talon')
             
             if self.testing:
-                logging.debug(f'Personalizer.PersonalCommandContext.PersonalCommandContext.get_source_file_path: returning {user_path=}')
+                logging.debug('Personalizer.PersonalCommandContext._find_source_file_path: returning user_path=%r', user_path)
             
             return user_path
 
@@ -437,7 +541,50 @@ class Personalizer():
         # WIP - this could be implemented as a custom class, so we could transparently
         # WIP - handle both str and Path types as keys, interchangeably. then, we wouldn't
         # WIP - have to be so careful to avoid mixing them throughout the rest of the code.
-        self._updated_paths = {}
+        # each entry, keyed by normalized path (see _path_key()), holds the (mtime, size, content digest)
+        # of the file. the digest is taken whenever a file is recorded as new or modified, so that a later
+        # change of timestamp alone can be recognized.
+        self._updated_paths: OrderedDict[str, Tuple[int, int, str]] = OrderedDict()
+
+        # paths watched by this module, by callback method
+        self._watched_paths: Dict[Callable, Set[str]] = defaultdict(set)
+
+        # watch changes not yet passed on to Talon, by (callback method, path). while a batch is
+        # open these accumulate, so a path which is unwatched and then watched again (as happens
+        # on every reload) is simply left alone.
+        self._pending_watches: Dict[Tuple[Callable, str], bool] = {}
+
+        # generated files to be removed when the current batch is done, unless they are generated
+        # again in the meantime.
+        self._pending_purges: Set[str] = set()
+        self._batch_depth = 0
+
+        # digests of the generated files, by path, so unchanged files need not be written again
+        self._generated_digests: Dict[str, str] = {}
+
+        # formatted headers of personalized files, by context path
+        self._personalized_headers: Dict[str, str] = {}
+
+        # folders known to exist under the personalized folder
+        self._ensured_folders: Set[str] = set()
+
+        # file system events waiting to be processed, by handler method and path, and the cron
+        # job which will process them.
+        self._pending_events: Dict[Callable, Dict[str, Any]] = {}
+        self._pending_events_job = None
+        self._pending_events_since = 0
+
+        # parsed contents of config files, keyed by real path and escape character. each entry
+        # holds the (mtime, size) of the file when it was read, so unchanged files are not re-parsed.
+        self._csv_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], List[List[str]]]] = {}
+
+        # signature of the config files as of the last full load, used to skip redundant reloads
+        self._loaded_config_signature = None
+
+        # contexts fed by each auxiliary config file, by real path, so that a change to one of
+        # those files only reloads the contexts it affects. rebuilt on every full load.
+        self._list_config_file_contexts: Dict[str, Set[str]] = defaultdict(set)
+        self._command_config_file_contexts: Dict[str, Set[str]] = defaultdict(set)
 
         self.control_file_name = 'control.csv'
 
@@ -448,6 +595,8 @@ class Personalizer():
         # folder where personalized contexts are kept
         self.personal_folder_name = '_personalizations'
         self.personal_folder_path =  self.personalization_root_folder_path / self.personal_folder_name
+        # normalized (see _path_key()), so the check against it ignores case where the file system does
+        self._personal_folder_prefix = os.path.join(_path_key(str(self.personal_folder_path)), '')
 
         self.personalization_context_path_prefix = self._get_personalization_context_path_prefix()
 
@@ -456,6 +605,12 @@ class Personalizer():
         self.personal_config_folder = self.personalization_root_folder_path / self.personal_config_folder_name
         makedirs(self.personal_config_folder, mode=0o755, exist_ok=True)
 
+        # resolved once here, these are compared against the (real) paths we get from Talon
+        self._real_personal_config_folder = os.path.realpath(self.personal_config_folder)
+        self._real_personal_config_folder_prefix = os.path.join(_path_key(self._real_personal_config_folder), '')
+        self._talon_user = actions.path.talon_user()
+        self._real_talon_user = os.path.realpath(self._talon_user)
+
         # we monitor this folder if the config directory ever disappears, looking for a reappearance
         self.personal_config_folder_parent = self.personal_config_folder.parents[0]
 
@@ -464,12 +619,24 @@ class Personalizer():
         self.personal_list_control_file_subpath = os.path.join(self.personal_list_folder_name, self.control_file_name)
         self.personal_list_control_file_path = os.path.join(self.personal_config_folder, self.personal_list_folder_name)
         makedirs(self.personal_list_control_file_path, mode=0o755, exist_ok=True)
+        self._list_control_file = os.path.join(self.personal_config_folder, self.personal_list_control_file_subpath)
 
         # config sub folder for command personalizations
         self.personal_command_folder_name = 'command_personalization'
         self.personal_command_control_file_subpath = os.path.join(self.personal_command_folder_name, self.control_file_name)
         self.personal_command_control_file_path = os.path.join(self.personal_config_folder, self.personal_command_folder_name)
         makedirs(self.personal_command_control_file_path, mode=0o755, exist_ok=True)
+        self._command_control_file = os.path.join(self.personal_config_folder, self.personal_command_control_file_subpath)
+
+        # real path prefixes of the config sub folders, used to classify file system events cheaply
+        self._list_config_prefix = os.path.join(os.path.realpath(self.personal_list_control_file_path), '')
+        self._command_config_prefix = os.path.join(os.path.realpath(self.personal_command_control_file_path), '')
+
+        # the kind of config file found directly in each of the config sub folders, by real path
+        self._config_kinds_by_folder = {
+            os.path.realpath(self.personal_list_control_file_path): 'list',
+            os.path.realpath(self.personal_command_control_file_path): 'command',
+        }
         
         # header written to personalized context files
         self.personalized_header = r"""
@@ -504,6 +671,11 @@ class Personalizer():
         
     @enabled.setter
     def enabled(self, value) -> None:
+        if value == self._enabled:
+            # Talon reports settings again whenever a settings file is reloaded, skip the
+            # reload unless the value has actually changed.
+            return
+
         self._enabled = value
 
         if self._enabled:
@@ -537,6 +709,10 @@ class Personalizer():
         #     # logging.debug(f'Personalizer.refresh_settings: {self.settings_map=}')
         #     logging.debug(f'Personalizer.refresh_settings: args: {args=}')
 
+        if args and args[0] not in self.refresh_map:
+            # not one of our settings, nothing to do here or in the personalized contexts
+            return
+
         caller_id = 'Personalizer'
         if args:
             Personalizer._update_setting(self, caller_id, args)
@@ -557,7 +733,7 @@ class Personalizer():
                 caller.__setattr__(local_name, talon_setting.get())
 
             if caller.testing:
-                logging.debug(f'Personalizer.{caller_id}._update_all_settings: received updated value for {talon_setting.path}: {getattr(caller, local_name, None)}')
+                logging.debug('Personalizer.%s._update_all_settings: received updated value for %s: %s', caller_id, talon_setting.path, getattr(caller, local_name, None))
 
     @classmethod
     def _update_setting(cls, caller, caller_id: str, args):
@@ -576,28 +752,65 @@ class Personalizer():
         #         logging.debug(f'Personalizer.{caller_id}._update_setting: {caller=}, {talon_name=}, {local_name=}, {type(local_name)=}')
 
         if caller.testing:
-            logging.debug(f'Personalizer.{caller_id}._update_setting: received updated value for {talon_name}: {getattr(caller, local_name, None)}')
+            logging.debug('Personalizer.%s._update_setting: received updated value for %s: %s', caller_id, talon_name, getattr(caller, local_name, None))
 
     def startup(self) -> None:
         """Load/unload personalizations, based on whether the feature is enabled or not."""
         with self._personalization_mutex:
             if self.enabled:
                 self.load_personalizations()
+
+                # monitor the config folder for changes, as is done when the feature is enabled
+                # via the setting.
+                self._watch(self.personal_config_folder, self._update_config)
             else:
                 self.unload_personalizations()
 
+    def reload_personalizations(self) -> None:
+        """Unload and then load all personalizations."""
+        with self._batched_updates():
+            self.unload_personalizations()
+            self.load_personalizations()
+
     def load_personalizations(self) -> None:
         """Load defined personalizations."""
-        with self._personalization_mutex:
+        with self._batched_updates():
+            signature = self._get_config_signature()
+            if self._personalizations:
+                if signature == self._loaded_config_signature:
+                    if self.testing:
+                        logging.debug('Personalizer.load_personalizations: configuration is unchanged, skipping reload')
+                    return
+
+                # the configuration has changed since the last load, start over rather than
+                # applying it on top of the existing personalizations.
+                self.unload_personalizations()
+
             self._ctx.tags = [self.personalization_tag_name_qualified]
             self.load_list_personalizations()
             self.load_command_personalizations()
             self.generate_files()
 
+            self._loaded_config_signature = signature
+
             if self._personalizations:
                 if monitor_registry_for_updates:
                     registry.register("", self._update_context)                
 
+    def _get_config_signature(self) -> Tuple:
+        """Internal method returning the name, mtime and size of every config file, for change detection."""
+        signature = []
+        for folder_name in (self.personal_list_folder_name, self.personal_command_folder_name):
+            try:
+                with os.scandir(self.personal_config_folder / folder_name) as entries:
+                    for entry in entries:
+                        st = entry.stat()
+                        signature.append((folder_name, entry.name, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                pass
+
+        return tuple(sorted(signature))
+
     def _validate_source_file_path(self, source_file_path_in: str) -> Tuple[str, str]:
         """Validate given file path, which is assumed to have been read from a control file
         and which may require some transformation."""
@@ -606,11 +819,11 @@ class Personalizer():
         source_file_path = None
         if os.path.sep in source_file_path_in:
             # seems to be a 'normal' filepath
-            source_file_path = os.path.sep.join([actions.path.talon_user(), source_file_path_in])
+            source_file_path = os.path.sep.join([self._talon_user, source_file_path_in])
             context_path = self._get_context_from_path(source_file_path)
         else:
             # could be a 'normal' file in the top level of the user directory, let's see...
-            source_file_path = os.path.sep.join([actions.path.talon_user(), source_file_path_in])
+            source_file_path = os.path.sep.join([self._talon_user, source_file_path_in])
             if not os.path.exists(source_file_path):
                 # not a top level file, maybe it's a 'universal', i.e. context, path..
                 context_path = source_file_path_in
@@ -625,7 +838,7 @@ class Personalizer():
                     raise ValueError(f'given context path yields ambiguous file paths: {source_file_path_in} => {paths}')
                 source_file_path = paths[0]
 
-        if Path(source_file_path).is_relative_to(self.personal_folder_path):
+        if _path_key(source_file_path).startswith(self._personal_folder_prefix):
             raise ValueError('cannot personalize personalized files')
 
         return source_file_path, context_path 
@@ -637,31 +850,53 @@ class Personalizer():
             raise ValueError('load_list_personalizations: bad arguments - cannot accept both "target_contexts" and "target_config_paths" at the same time.')
             
         if target_contexts:
+            # checked for every line of the control file, so make that cheap
+            target_contexts = frozenset(target_contexts)
             if self.testing:
-                logging.debug(f'Personalizer.load_list_personalizations: {target_contexts=}')
+                logging.debug('Personalizer.load_list_personalizations: target_contexts=%r', target_contexts)
             
         # use str, not Path
-        nominal_control_file = self.personal_config_folder / self.personal_list_control_file_subpath
-        control_file = os.path.realpath(nominal_control_file)
+        nominal_control_file = self._list_control_file
+        control_file = _realpath(nominal_control_file)
 
         if not os.path.exists(control_file):
             return
         
         if self.testing:
-            logging.debug(f'Personalizer.load_list_personalizations: loading customizations from "{control_file}"...')
+            logging.debug('Personalizer.load_list_personalizations: loading customizations from "%s"...', control_file)
         
-        if target_config_paths and control_file in target_config_paths:
-            # if we're reloading the control file, then we're doing everything anyways
-            target_config_paths = None
+        if target_config_paths:
+            # use a set of real paths, so the lookups below are cheap. this is a copy, which we consume as we go.
+            target_config_paths = {_realpath(path) for path in target_config_paths}
+            if control_file in target_config_paths:
+                # if we're reloading the control file, then we're doing everything anyways
+                target_config_paths = None
+
+        # auxiliary files are resolved relative to this folder
+        auxiliary_folder = self.personal_list_control_file_path
+        # list the folder once, so most lines don't need a stat() of their own
+        auxiliary_file_names = self._get_folder_file_names(auxiliary_folder)
+
+        # looked up once, rather than going through the registry for every line
+        source_contexts = registry.contexts
+
+        config_file_contexts = self._list_config_file_contexts
+        if not (target_contexts or target_config_paths):
+            config_file_contexts.clear()
 
         try:
             # loop through the control file and do the needful
             line_number = 0
-            for action, source_file_path, target_list_name, *remainder in self._get_config_lines(control_file, escapechar=None):
+            for row in self._get_config_lines(control_file, escapechar=None):
                 line_number += 1
+                # the file name is optional (see REPLACE below). index rather than unpack with *remainder,
+                # which would build a new list for every line.
+                action, source_file_path, target_list_name = row[0], row[1], row[2]
+                config_file_name = row[3] if len(row) > 3 else None
+                action = action.upper()
 
                 if self.testing:
-                    logging.debug(f'Personalizer.load_list_personalizations: read line {line_number}: {action=}, {source_file_path=}, {target_list_name=}, {remainder}')
+                    logging.debug('Personalizer.load_list_personalizations: read line %d: action=%r, source_file_path=%r, target_list_name=%r, config_file_name=%r', line_number, action, source_file_path, target_list_name, config_file_name)
 
                 try:
                     source_file_path, target_ctx_path = self._validate_source_file_path(source_file_path)
@@ -669,33 +904,34 @@ class Personalizer():
                     logging.error(f'load_list_personalizations: {control_file}, SKIPPING at line {line_number} - {str(e)}')
                     continue
 
+                if target_contexts:
+                    # we are loading some, not all, contexts. check this first, so we don't look at the
+                    # file system for lines that don't concern us.
+                    if not target_ctx_path in target_contexts:
+                        # current target is not in the list of targets, skip
+                        if self.testing:
+                            logging.debug('Personalizer.load_list_personalizations: %s, SKIPPING at line %d - %s not in given list of target contexts', control_file, line_number, target_ctx_path)
+                        continue
+
                 # handle mapping of 'self' to 'user' 
                 target_list_name = re.sub(r"^self\.", "user.", target_list_name)
 
                 # determine the CSV file path, check error cases and establish config file watches
                 auxiliary_file_path = None
-                if len(remainder):
+                if config_file_name is not None:
                     # use str, not Path
-                    nominal_auxiliary_file_path = str(self.personal_config_folder / self.personal_list_folder_name / remainder[0])
-                    auxiliary_file_path = os.path.realpath(nominal_auxiliary_file_path)
-                    if not os.path.exists(auxiliary_file_path):
-                        logging.error(f'load_list_personalizations: file not found for {action.upper()} entry, skipping: "{auxiliary_file_path}"')
+                    nominal_auxiliary_file_path = os.path.join(auxiliary_folder, config_file_name)
+                    auxiliary_file_path = _realpath(nominal_auxiliary_file_path)
+                    config_file_contexts[auxiliary_file_path].add(target_ctx_path)
+                    if not (config_file_name in auxiliary_file_names or os.path.exists(auxiliary_file_path)):
+                        logging.error(f'load_list_personalizations: file not found for {action} entry, skipping: "{auxiliary_file_path}"')
                         continue
-                elif action.upper() != 'REPLACE':
-                    logging.error(f'load_list_personalizations: missing file name for {action.upper()} entry, skipping: "{target_list_name}"')
+                elif action != 'REPLACE':
+                    logging.error(f'load_list_personalizations: missing file name for {action} entry, skipping: "{target_list_name}"')
                     continue
 
-                if target_contexts:
-                    # # we are loading some, not all, contexts. see if the current target matches given list.
-                    # for ctx_path in target_contexts:
-                    if not target_ctx_path in target_contexts:
-                        # current target is not in the list of targets, skip
-                        if self.testing:
-                            logging.debug(f'Personalizer.load_list_personalizations: {control_file}, SKIPPING at line {line_number} - {target_ctx_path} not in given list of target contexts')
-                        continue
-                    
                 if self.testing:
-                    logging.debug(f'Personalizer.load_list_personalizations: at line {line_number} - {action, target_ctx_path, target_list_name, remainder}')
+                    logging.debug('Personalizer.load_list_personalizations: at line %d - %s', line_number, (action, target_ctx_path, target_list_name, config_file_name))
 
                 if target_config_paths:
                     # we are loading some, not all, paths. see if the current path matches our list.
@@ -704,14 +940,14 @@ class Personalizer():
                         #if self.testing:
                         #    logging.debug(f'Personalizer.load_list_personalizations: loading {real_config_file_path}, because it is in given list of target config paths"')
                         
-                        # consume the list as we go so at the end we know if we missed any paths
-                        target_config_paths.remove(auxiliary_file_path)
+                        # consume the set as we go so at the end we know if we missed any paths
+                        target_config_paths.discard(auxiliary_file_path)
                     else:
                         if self.testing:
-                            logging.debug(f'Personalizer.load_list_personalizations: {control_file}, SKIPPING at line {line_number} - {auxiliary_file_path} is NOT in given list of target config paths.')
+                            logging.debug('Personalizer.load_list_personalizations: %s, SKIPPING at line %d - %s is NOT in given list of target config paths.', control_file, line_number, auxiliary_file_path)
                         continue
 
-                if not target_ctx_path in registry.contexts:
+                if not target_ctx_path in source_contexts:
                     logging.error(f'load_list_personalizations: cannot redefine a context that does not exist, skipping: "{target_ctx_path}"')
                     continue
                 
@@ -725,9 +961,6 @@ class Personalizer():
                     logging.error(f'load_list_personalizations: {control_file}, SKIPPING at line {line_number} - {str(e)}')
                     continue
 
-                #if self.testing:
-                #    logging.debug(f'Personalizer.load_list_personalizations: AFTER {action.upper()}, {value=}')
-
                 # make sure we are monitoring the source file for changes
                 if monitor_filesystem_for_updates:
                     self._watch_source_file_for_context(target_ctx_path, self._update_personalizations)
@@ -736,6 +969,8 @@ class Personalizer():
                     updated_contexts.add(target_ctx_path)
                 self._configured_contexts.add(target_ctx_path)
         
+        except (FilenameError, LoadError) as e:
+            logging.error(f'load_list_personalizations: {control_file}, at line {line_number} - {str(e)}')
         except FileNotFoundError as e:
             # below check is necessary because the inner try blocks above do not catch this error
             # completely...something's odd about the way Talon is handling these exceptions.
@@ -743,79 +978,106 @@ class Personalizer():
 
     def load_one_list_context(self, action: str, target_ctx_path: str, target_list_name: List[str], config_file_path: str) -> None:
         """Load a single list context."""
-        
+
+        action = action.upper()
+
+        handler = self._list_action_handlers.get(action)
+        if handler is None:
+            raise LoadError(f'unknown action, skipping: "{action}"')
+
         try:
-            target_list = self.get_list_personalization(target_ctx_path, target_list_name)
-        except KeyError as e:
+            personal_context = self.get_personalizations(target_ctx_path)
+            handler(self, action, personal_context, target_list_name, config_file_path)
+        except (KeyError, ValueError) as e:
             raise LoadError(f'load_one_list_context: not found: {str(e)}')
 
-        if action.upper() == 'DELETE':
-            deletions = []
-            try:
-                # load items from config file
-                deletions = self._load_count_items_per_row(1, config_file_path)
-            except ItemCountError:
-                raise LoadError(f'files containing deletions must have just one value per line, skipping entire file: "{config_file_path}"')
-                
-            except FileNotFoundError:
-                raise LoadError(f'missing file for delete entry, skipping: "{config_file_path}"')
+    def _delete_list_items(self, action: str, personal_context: PersonalListContext, target_list_name: str, config_file_path: str) -> None:
+        """Internal method to apply a DELETE entry to a personalized list."""
+        target_ctx_path = personal_context.ctx_path
+        target_list = personal_context.get_list(target_list_name)
 
-            #if self.testing:            
-            #    logging.debug(f'Personalizer.load_one_list_context: {deletions=}')
+        deletions = set()
+        try:
+            # load items from config file
+            deletions = {row[0] for row in self._load_count_items_per_row(1, config_file_path)}
+        except ItemCountError:
+            raise LoadError(f'files containing deletions must have just one value per line, skipping entire file: "{config_file_path}"')
+            
+        except FileNotFoundError:
+            raise LoadError(f'missing file for delete entry, skipping: "{config_file_path}"')
 
-            for d in deletions:
-                try:
-                    del target_list[d[0]]
-                except KeyError:
-                    # logging.warning(f'load_one_list_context: target list does not contain item to be deleted: target context: {target_ctx_path}, target item: {d[0]}, target list: {target_list_name} = "{target_list}"')
-                    raise LoadError(f'load_one_list_context: target list does not contain item to be deleted: target context: {target_ctx_path}, target item: {d[0]}, target list: {target_list_name} = "{target_list}"')
-
-        elif action.upper() == 'ADD' or action.upper() == 'REPLACE' or action.upper() == 'REPLACE_KEY':
-            additions = {}
-            if config_file_path:  # some REPLACE entries may not have filenames, and that's okay
-                try:
-                    for row in self._load_count_items_per_row(2, config_file_path):
-                        if action.upper() == 'ADD' or action.upper() == 'REPLACE':
-                            # assign key to value
-                            additions[ row[0] ] = row[1]
-                        elif action.upper() == 'REPLACE_KEY':
-                            old_key = row[0]
-                            new_key = row[1]
-
-                            if self.testing:
-                                logging.debug(f'Personalizer.load_one_list_context: REPLACE_KEY - {old_key=}, {new_key=}')
-
-                            if old_key == new_key:
-                                # nothing to do
-                                continue
-                            
-                            try:
-                                # assign value for old key to new key
-                                additions[new_key] = target_list[old_key]
-                                # remove old key
-                                del target_list[old_key]
-                            except KeyError:
-                                raise LoadError(f'cannot replace a key that does not exist in the target list, skipping: "{old_key}"')
+        #if self.testing:            
+        #    logging.debug(f'Personalizer._delete_list_items: {deletions=}')
 
-                    if self.testing:
-                        logging.debug(f'Personalizer.load_one_list_context: {additions=}')
-                except ItemCountError:
-                    raise LoadError(f'files containing additions must have just two values per line, skipping entire file: "{config_file_path}"')
-                    
-                except FileNotFoundError:
-                    raise LoadError(f'missing file for add or replace entry, skipping: "{config_file_path}"')
-            
-            if action.upper() == 'REPLACE':
-                target_list.clear()
-            
-            target_list.update(additions)
+        # check for missing items before deleting anything, so a bad file leaves the list untouched
+        missing = deletions - target_list.keys()
+        if missing:
+            # logging.warning(f'load_one_list_context: target list does not contain item to be deleted: target context: {target_ctx_path}, target item: {missing}, target list: {target_list_name} = "{target_list}"')
+            raise LoadError(f'load_one_list_context: target list does not contain item to be deleted: target context: {target_ctx_path}, target item: {", ".join(sorted(missing))}, target list: {target_list_name} = "{target_list}"')
 
-            if self.testing:
-                logging.debug(f'Personalizer.load_one_list_context: AFTER UPDATE - {target_list=}')
+        for d in deletions:
+            del target_list[d]
+
+    def _update_list_items(self, action: str, personal_context: PersonalListContext, target_list_name: str, config_file_path: str) -> None:
+        """Internal method to apply an ADD, REPLACE or REPLACE_KEY entry to a personalized list."""
+        # the source list is not needed when replacing the whole thing
+        target_list = None if action == 'REPLACE' else personal_context.get_list(target_list_name)
+
+        additions = {}
+        if config_file_path:  # some REPLACE entries may not have filenames, and that's okay
+            try:
+                rows = self._load_count_items_per_row(2, config_file_path)
+                if action in _ADD_OR_REPLACE:
+                    # assign key to value
+                    additions = dict(rows)
+                elif action == 'REPLACE_KEY':
+                    # rows are read as we go, so don't modify the list until all of them have been
+                    # checked.
+                    replaced_keys = []
+                    for old_key, new_key in rows:
+                        if self.testing:
+                            logging.debug('Personalizer._update_list_items: REPLACE_KEY - old_key=%r, new_key=%r', old_key, new_key)
+
+                        if old_key == new_key:
+                            # nothing to do
+                            continue
+                        
+                        try:
+                            # assign value for old key to new key
+                            additions[new_key] = target_list[old_key]
+                        except KeyError:
+                            raise LoadError(f'cannot replace a key that does not exist in the target list, skipping: "{old_key}"')
+                        replaced_keys.append(old_key)
+
+                    # remove old keys
+                    for old_key in replaced_keys:
+                        target_list.pop(old_key, None)
+
+                if self.testing:
+                    logging.debug('Personalizer._update_list_items: additions=%r', additions)
+            except ItemCountError:
+                raise LoadError(f'files containing additions must have just two values per line, skipping entire file: "{config_file_path}"')
+                
+            except FileNotFoundError:
+                raise LoadError(f'missing file for add or replace entry, skipping: "{config_file_path}"')
+        
+        if action == 'REPLACE':
+            # the additions are the new list, no need to copy them
+            personal_context.set_list(target_list_name, additions)
+            target_list = additions
         else:
-            raise LoadError(f'unknown action, skipping: "{action}"')
+            target_list.update(additions)
 
-        return
+        if self.testing:
+            logging.debug('Personalizer._update_list_items: AFTER UPDATE - target_list=%r', target_list)
+
+    # list control file actions, mapped to the methods which apply them
+    _list_action_handlers = {
+        'DELETE': _delete_list_items,
+        'ADD': _update_list_items,
+        'REPLACE': _update_list_items,
+        'REPLACE_KEY': _update_list_items,
+    }
 
     def load_command_personalizations(self, target_contexts: List[str] = [], target_config_paths: List[str] = [], updated_contexts=None) -> None:
         """Load some (or all) defined command personalizations."""
@@ -823,28 +1085,48 @@ class Personalizer():
         if target_contexts and target_config_paths:
             raise ValueError('load_command_personalizations: bad arguments - cannot accept both "target_contexts" and "target_config_paths" at the same time.')
 
+        if target_contexts:
+            # checked for every line of the control file, so make that cheap
+            target_contexts = frozenset(target_contexts)
+
         # use str, not Path
-        nominal_control_file = self.personal_config_folder / self.personal_command_control_file_subpath
-        control_file = os.path.realpath(nominal_control_file)
+        nominal_control_file = self._command_control_file
+        control_file = _realpath(nominal_control_file)
 
         if not os.path.exists(control_file):
             return
         
         if self.testing:
-            logging.debug(f'Personalizer.load_command_personalizations: loading customizations from "{control_file}"...')
+            logging.debug('Personalizer.load_command_personalizations: loading customizations from "%s"...', control_file)
         
-        if target_config_paths and control_file in target_config_paths:
-            # if we're reloading the control file, then we're doing everything anyways
-            target_config_paths = None
+        if target_config_paths:
+            # use a set of real paths, so the lookups below are cheap. this is a copy, which we consume as we go.
+            target_config_paths = {_realpath(path) for path in target_config_paths}
+            if control_file in target_config_paths:
+                # if we're reloading the control file, then we're doing everything anyways
+                target_config_paths = None
             
+        # auxiliary files are resolved relative to this folder
+        auxiliary_folder = self.personal_command_control_file_path
+        # list the folder once, so most lines don't need a stat() of their own
+        auxiliary_file_names = self._get_folder_file_names(auxiliary_folder)
+
+        # looked up once, rather than going through the registry for every line
+        source_contexts = registry.contexts
+
+        config_file_contexts = self._command_config_file_contexts
+        if not (target_contexts or target_config_paths):
+            config_file_contexts.clear()
+
         try:
             # loop through the control file and do the needful
             line_number = 0
             for action, source_file_path, config_file_name in self._get_config_lines(control_file, escapechar=None):
                 line_number += 1
+                action = action.upper()
 
                 if self.testing:
-                    logging.debug(f'Personalizer.load_command_personalizations: read line {line_number}: {action=}, {source_file_path=}, {config_file_name=}')
+                    logging.debug('Personalizer.load_command_personalizations: read line %d: action=%r, source_file_path=%r, config_file_name=%r', line_number, action, source_file_path, config_file_name)
 
                 try:
                     source_file_path, target_ctx_path = self._validate_source_file_path(source_file_path)
@@ -852,39 +1134,40 @@ class Personalizer():
                     logging.error(f'load_command_personalizations: {control_file}, SKIPPING at line {line_number} - {str(e)}')
                     continue
 
+                if target_contexts and not target_ctx_path in target_contexts:
+                    # current target is not in the list of targets, skip. this is checked first, so we
+                    # don't look at the file system for lines that don't concern us.
+                    if self.testing:
+                        logging.debug('Personalizer.load_command_personalizations: %s, SKIPPING at line %d - %s not in list of target contexts', nominal_control_file, line_number, target_ctx_path)
+                    continue
+
                 # determine the CSV file path, check error cases and establish config file watches
                 # use str, not Path
-                nominal_auxiliary_file_path = str(self.personal_config_folder / self.personal_command_folder_name / config_file_name)
-                auxiliary_file_path = os.path.realpath(nominal_auxiliary_file_path)
-                if not os.path.exists(auxiliary_file_path):
-                    logging.error(f'load_command_personalizations: {nominal_control_file}, at line {line_number} - file not found for {action.upper()} entry, skipping: "{auxiliary_file_path}"')
+                nominal_auxiliary_file_path = os.path.join(auxiliary_folder, config_file_name)
+                auxiliary_file_path = _realpath(nominal_auxiliary_file_path)
+                config_file_contexts[auxiliary_file_path].add(target_ctx_path)
+                if not (config_file_name in auxiliary_file_names or os.path.exists(auxiliary_file_path)):
+                    logging.error(f'load_command_personalizations: {nominal_control_file}, at line {line_number} - file not found for {action} entry, skipping: "{auxiliary_file_path}"')
                     continue
                 
                 if self.testing:
-                    logging.debug(f'Personalizer.load_command_personalizations: at line {line_number} - {target_ctx_path, action, config_file_name}')
-
-                if target_contexts and not target_ctx_path in target_contexts:
-                    # current target is not in the list of targets, skip
-                    if self.testing:
-                        logging.debug(f'Personalizer.load_command_personalizations: {nominal_control_file}, SKIPPING at line {line_number} - {target_ctx_path} not in list of target contexts')
-                    continue
+                    logging.debug('Personalizer.load_command_personalizations: at line %d - %s', line_number, (target_ctx_path, action, config_file_name))
 
                 if target_config_paths:
                     if auxiliary_file_path in target_config_paths:
-                        # consume the list as we go so at the end we know if we missed any paths
-                        target_config_paths.remove(auxiliary_file_path)
+                        # consume the set as we go so at the end we know if we missed any paths
+                        target_config_paths.discard(auxiliary_file_path)
                     else:
                         if self.testing:
-                            logging.debug(f'Personalizer.load_command_personalizations: {nominal_control_file}, SKIPPING at line {line_number} - {auxiliary_file_path} is NOT in given list of target config paths')
+                            logging.debug('Personalizer.load_command_personalizations: %s, SKIPPING at line %d - %s is NOT in given list of target config paths', nominal_control_file, line_number, auxiliary_file_path)
                         continue
 
-                if not target_ctx_path in registry.contexts:
+                if not target_ctx_path in source_contexts:
                     logging.error(f'load_command_personalizations: {nominal_control_file}, at line {line_number} - cannot personalize commands for a context that does not exist, skipping: "{target_ctx_path}"')
                     continue
 
-                value = None
                 try:
-                    value = self.load_one_command_context(action, target_ctx_path, auxiliary_file_path)
+                    self.load_one_command_context(action, target_ctx_path, auxiliary_file_path)
                 except LoadError as e:
                     logging.error(f'load_command_personalizations: {nominal_control_file}, at line {line_number} - {str(e)}')
                     continue
@@ -909,70 +1192,107 @@ class Personalizer():
     def load_one_command_context(self, action: str, target_ctx_path : str, config_file_path : str) -> None:
         """Load a single command context."""
 
+        action = action.upper()
+
+        handler = self._command_action_handlers.get(action)
+        if handler is None:
+            raise LoadError(f'unknown action, skipping: "{action}"')
+
         try:
             commands = self.get_personalizations(target_ctx_path)
         except KeyError as e:
             raise LoadError(f'load_one_command_context: not found: {str(e)}')
 
         if self.testing:
-            logging.debug(f'Personalizer.load_one_command_context: {commands.commands=}')
+            logging.debug('Personalizer.load_one_command_context: commands.commands=%r', commands.commands)
 
-        if action.upper() == 'DELETE':
-            deletions = []
-            try:
-                # load items from source file
-                deletions = self._load_count_items_per_row(1, config_file_path)
-            except ItemCountError:
-                raise LoadError(f'files containing deletions must have just one value per line, skipping entire file: "{config_file_path}"')
-            except FileNotFoundError:
-                raise LoadError(f'missing file for delete entry, skipping: "{config_file_path}"')
+        handler(self, action, target_ctx_path, commands, config_file_path)
 
-            #if self.testing:
-            #    logging.debug(f'Personalizer.load_one_command_context: {deletions=}')
+        #if self.testing:
+        #    logging.debug(f'Personalizer.load_one_command_context: AFTER {action}, {commands=}')
 
-            for row in deletions:
-                k = row[0]
-                commands.remove(k)
-            
-        elif action.upper() == 'ADD' or action.upper() == 'REPLACE':
-            try:
-                # load items from source file
-                for row in self._load_count_items_per_row(2, config_file_path):
-                    target_command = row[0]
-                    replacement_command = row[1]
-
-                    try:
-                        # fetch the command implementation from Talon
-                        impl = registry.contexts[target_ctx_path].commands[target_command].target.code
-                    except KeyError as e:
-                        raise LoadError(f'cannot replace a command that does not exist, skipping: "{target_command}"')
-                    
-                    # record changes
-                    if action.upper() == 'REPLACE':            
-                        commands.remove(target_command)
-                    commands.replace(replacement_command, impl)
-            except ItemCountError:
-                raise LoadError(f'files containing additions must have just two values per line, skipping entire file: "{config_file_path}"')
-            except FileNotFoundError:
-                raise LoadError(f'missing file for add or replace entry, skipping: "{config_file_path}"')
-            
-        else:
-            raise LoadError(f'unknown action, skipping: "{action}"')
+    def _delete_commands(self, action: str, target_ctx_path: str, commands: PersonalCommandContext, config_file_path: str) -> None:
+        """Internal method to apply a DELETE entry to a personalized command context."""
+        deletions = {}
+        try:
+            # load items from source file. a dict rather than a set, to keep the order of the file - deleted
+            # commands which are not in the source context are appended to the personalized file in this order.
+            deletions = dict.fromkeys(row[0] for row in self._load_count_items_per_row(1, config_file_path))
+        except ItemCountError:
+            raise LoadError(f'files containing deletions must have just one value per line, skipping entire file: "{config_file_path}"')
+        except FileNotFoundError:
+            raise LoadError(f'missing file for delete entry, skipping: "{config_file_path}"')
 
         #if self.testing:
-        #    logging.debug(f'Personalizer.load_one_command_context: AFTER {action.upper()}, {commands=}')
-        
-        return
+        #    logging.debug(f'Personalizer._delete_commands: {deletions=}')
 
-    def _load_count_items_per_row(self, items_per_row: int, file_path: str) -> List[List[str]]:
-        """Internal method to read a CSV file expected to have a fixed number of items per row."""
-        items = []
+        commands.bulk_remove(deletions)
+
+    def _replace_commands(self, action: str, target_ctx_path: str, commands: PersonalCommandContext, config_file_path: str) -> None:
+        """Internal method to apply an ADD or REPLACE entry to a personalized command context."""
+        # the source commands are the same for every row
+        source_commands = registry.contexts[target_ctx_path].commands
+        # collect the changes for the whole file, then apply them in one go
+        changes = {}
+        try:
+            # load items from source file
+            for target_command, replacement_command in self._load_count_items_per_row(2, config_file_path):
+                try:
+                    # fetch the command implementation from Talon
+                    impl = source_commands[target_command].target.code
+                except KeyError as e:
+                    raise LoadError(f'cannot replace a command that does not exist, skipping: "{target_command}"')
+                
+                # record changes, in file order so later rows win
+                if action == 'REPLACE':
+                    changes[target_command] = 'skip()'
+                changes[replacement_command] = impl
+        except ItemCountError:
+            raise LoadError(f'files containing additions must have just two values per line, skipping entire file: "{config_file_path}"')
+        except FileNotFoundError:
+            raise LoadError(f'missing file for add or replace entry, skipping: "{config_file_path}"')
+
+        commands.bulk_replace(changes)
+
+    # command control file actions, mapped to the methods which apply them
+    _command_action_handlers = {
+        'DELETE': _delete_commands,
+        'ADD': _replace_commands,
+        'REPLACE': _replace_commands,
+    }
+
+    def _load_count_items_per_row(self, items_per_row: int, file_path: str) -> Iterator[List[str]]:
+        """Internal generator to read a CSV file expected to have a fixed number of items per row."""
         for row in self._get_config_lines(file_path):
-            if len(row) > items_per_row:
+            if not row:
+                # skip blank lines
+                continue
+            if len(row) != items_per_row:
                 raise ItemCountError()
-            items.append(row)
+            yield row
 
-        return items
+    def _decode_config_file(self, data: bytes, path: str) -> str:
+        """Internal method to decode the contents of a config file."""
+        # UTF-8 first, with or without the byte order mark Excel writes for "CSV UTF-8"...
+        try:
+            return data.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            pass
+
+        # ...then the locale encoding, which is what Excel uses for plain CSV (e.g. cp1252 on Windows)
+        encoding = locale.getpreferredencoding(False)
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError as e:
+            raise LoadError(f'cannot decode file as UTF-8 or {encoding}, skipping: "{path}"')
+
+    def _get_folder_file_names(self, folder: str) -> Set[str]:
+        """Internal method returning the names of the files in given folder, or an empty set if it cannot be read."""
+        try:
+            with os.scandir(folder) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError as e:
+            return set()
 
     def _get_config_lines(self, path_string: str, escapechar: str ='\\') -> List[List[str]]:
         """Retrieves contents of config file in personalization config folder."""
@@ -982,24 +1302,51 @@ class Personalizer():
     def _get_lines_from_csv(self, path_string: str, escapechar: str ='\\') -> List[List[str]]:
         """Retrieves contents of CSV file in personalization config folder."""
         
-        path = Path(os.path.realpath(path_string))
+        realpath = _realpath(path_string)
         
-        personal_config_folder = os.path.realpath(self.personal_config_folder)
-        if not path.is_relative_to(personal_config_folder):
+        if not _path_key(realpath).startswith(self._real_personal_config_folder_prefix):
             # logging.debug(f'Personalizer.{get_lines_from_csv: path.parents[:]}')
             msg = f'get_lines_from_csv: file must be in the config folder, {self.personal_config_folder}, skipping: {path_string}'
             raise ValueError(msg)
 
-        if not path.suffix == ".csv":
-            raise FilenameError(f'get_lines_from_csv: file name must end in ".csv", skipping: {path}')
+        if not os.path.splitext(realpath)[1] == ".csv":
+            raise FilenameError(f'get_lines_from_csv: file name must end in ".csv", skipping: {realpath}')
 
-        realpath = os.path.realpath(str(path))
+        # logging.debug(f'Personalizer._get_lines_from_csv: {path_string} -> {realpath}')
 
-        # logging.debug(f'Personalizer._get_lines_from_csv: {path} -> {realpath}')
+        st = os.stat(realpath)
+        file_key = (st.st_mtime_ns, st.st_size)
+        cache_key = (realpath, escapechar)
+        cached = self._csv_cache.get(cache_key)
+        if cached and cached[0] == file_key:
+            return cached[1]
 
         rows = []
-        with open(realpath, "r") as f:
-            rows = list(csv.reader(f, escapechar=escapechar))
+        # read the whole file in one go. decoding the bytes ourselves skips the line ending translation
+        # of text mode, so do it here - Windows and old Mac (bare CR) files must load as well.
+        with open(realpath, "rb") as f:
+            text = self._decode_config_file(f.read(), realpath)
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        if '"' in text or (escapechar and escapechar in text):
+            dialect = _csv_dialects.get(escapechar)
+            try:
+                if dialect:
+                    reader = csv.reader(StringIO(text), dialect=dialect)
+                else:
+                    reader = csv.reader(StringIO(text), escapechar=escapechar)
+                rows = list(reader)
+            except csv.Error as e:
+                raise LoadError(f'cannot parse file, skipping: "{path_string}" - {str(e)}')
+        else:
+            # nothing quoted or escaped, so splitting on commas gives the same rows as csv.reader
+            lines = text.split('\n')
+            if not lines[-1]:
+                # final newline
+                lines.pop()
+            rows = [line.split(',') if line else [] for line in lines]
+
+        self._csv_cache[cache_key] = (file_key, rows)
 
         # logging.debug(f'Personalizer._get_lines_from_csv: returning {rows}')
         return rows
@@ -1011,61 +1358,104 @@ class Personalizer():
             return
 
         if self.testing:
-            logging.debug(f'Personalizer.generate_files: writing customizations to "{self.personal_folder_path}"...')
+            logging.debug('Personalizer.generate_files: writing customizations to "%s"...', self.personal_folder_path)
         
         if not target_contexts:
             target_contexts = self._personalizations.keys()
-            
-        self._purge_files(target_contexts=target_contexts)
 
         for ctx_path in target_contexts:
             if self.testing:
-                logging.debug(f'Personalizer.generate_files: {ctx_path=}')
+                logging.debug('Personalizer.generate_files: ctx_path=%r', ctx_path)
 
             filepath_prefix = self.get_personal_file_path(ctx_path)
             personal_context = self.get_personalizations(ctx_path)
-            header = self.personalized_header.format(ctx_path, self.personal_folder_name)
+            header = self._get_personalized_header(ctx_path)
+
+            content = personal_context.get_file_content(self.tag_expression, header)
+            # encoded just once, for both the digest and the write
+            data = content.encode('utf-8')
+            digest = hashlib.sha1(data).hexdigest()
+
+            known_digest = self._generated_digests.get(filepath_prefix)
+            if known_digest is None and not filepath_prefix in self._pending_purges:
+                # not written during this session, e.g. left over from the last one. if it is still
+                # the same, rewriting it would only make Talon reload it for nothing.
+                known_digest = self._get_file_digest(filepath_prefix)
+
+            # a file which is about to be purged is still on disk, so it can be kept as well
+            if known_digest == digest \
+                and (filepath_prefix in self._pending_purges or os.path.exists(filepath_prefix)):
+                if self.testing:
+                    logging.debug('Personalizer.generate_files: unchanged, skipping %s', filepath_prefix)
+                self._pending_purges.discard(filepath_prefix)
+                self._generated_digests[filepath_prefix] = digest
+                continue
+
+            if self.testing:
+                logging.debug('Personalizer.generate_files: writing customizations to "%s"...', filepath_prefix)
 
-            personal_context.write(filepath_prefix, self.tag_expression, header)
+            # write the whole file in one go, as UTF-8 with plain newlines on every platform
+            self._pending_purges.discard(filepath_prefix)
+            try:
+                with open(filepath_prefix, 'wb') as f:
+                    f.write(data)
+            except FileNotFoundError:
+                # the folder was removed behind our back since we last made sure it exists
+                makedirs(os.path.dirname(filepath_prefix), mode=0o755, exist_ok=True)
+                with open(filepath_prefix, 'wb') as f:
+                    f.write(data)
+            self._generated_digests[filepath_prefix] = digest
+
+    def _get_personalized_header(self, ctx_path: str) -> str:
+        """Internal method returning the header for the personalized file of given context."""
+        # the header only depends on the context path, so format it just once per context
+        header = self._personalized_headers.get(ctx_path)
+        if header is None:
+            header = self._personalized_headers[ctx_path] = self.personalized_header.format(ctx_path, self.personal_folder_name)
+        return header
 
     def unload_personalizations(self, target_paths: List[str] = None, is_matching_ctx: Callable = None) -> None:
         """Unload some (or all) personalized contexts."""
         with self._personalization_mutex:
             if is_matching_ctx:
-                target_paths = [self.get_personalizations(ctx_path).get_source_file_path() for ctx_path in self._personalizations]
+                # copy the keys, since unloading removes entries as we go
+                for ctx_path in list(self._personalizations):
+                    if not is_matching_ctx(ctx_path):
+                        if self.testing:
+                            logging.debug('Personalizer.unload_personalizations: target context does NOT match, skipping - %s', ctx_path)
+                        continue
+
+                    if self.testing:
+                        logging.debug('Personalizer.unload_personalizations: target context matches - %s', ctx_path)
 
-            if target_paths:
+                    self.unload_one_personalized_context(ctx_path)
+            elif target_paths:
                 for file_path in target_paths:
                     ctx_path = self._get_context_from_path(file_path)
                     
                     if self.testing:
-                        logging.debug(f'Personalizer.unload_personalizations: processing target path - {file_path}, {ctx_path}')
+                        logging.debug('Personalizer.unload_personalizations: processing target path - %s, %s', file_path, ctx_path)
                         
                     if ctx_path in self._personalizations:
                         if self.testing:
-                            logging.debug(f'Personalizer.unload_personalizations: target context is known - {ctx_path}')
-                            logging.debug(f'Personalizer.unload_personalizations: {is_matching_ctx=}')
-                            
-                        if is_matching_ctx:
-                            if not is_matching_ctx(ctx_path):
-                                if self.testing:
-                                    logging.debug(f'Personalizer.unload_personalizations: target context does NOT match, skipping...')
-                                continue
-                            else:
-                                if self.testing:
-                                    logging.debug(f'Personalizer.unload_personalizations: target context matches')
+                            logging.debug('Personalizer.unload_personalizations: target context is known - %s', ctx_path)
 
                         self.unload_one_personalized_context(ctx_path)
             else:
                 if self._personalizations:
 
                     if self.testing:
-                        logging.debug(f'Personalizer.unload_personalizations: unloading everything...')
+                        logging.debug('Personalizer.unload_personalizations: unloading everything...')
 
                     self._personalizations = {}
 
                     self._purge_files()
 
+                self._loaded_config_signature = None
+
+                # paths may resolve differently by the time we load again
+                _realpath.cache_clear()
+
             if not self._personalizations:
                 self._ctx.tags = []
 
@@ -1077,13 +1467,13 @@ class Personalizer():
                 
     def unload_list_personalizations(self) -> None:
         if self.testing:
-            logging.debug(f'Personalizer.unload_list_personalizations: starting...')
+            logging.debug('Personalizer.unload_list_personalizations: starting...')
             
         self.unload_personalizations(is_matching_ctx=lambda x: not self.is_talon_file_context(x))
 
     def unload_command_personalizations(self) -> None:
         if self.testing:
-            logging.debug(f'Personalizer.unload_command_personalizations: starting...')
+            logging.debug('Personalizer.unload_command_personalizations: starting...')
 
         self.unload_personalizations(is_matching_ctx=lambda x: self.is_talon_file_context(x))
 
@@ -1091,7 +1481,7 @@ class Personalizer():
         with self._personalization_mutex:
             if ctx_path in self._personalizations:
                 if self.testing:
-                    logging.debug(f'Personalizer.unload_one_personalized_context: unloading context {ctx_path}')
+                    logging.debug('Personalizer.unload_one_personalized_context: unloading context %s', ctx_path)
 
                 if monitor_filesystem_for_updates:
                     personal_context = self.get_personalizations(ctx_path)
@@ -1105,22 +1495,47 @@ class Personalizer():
 
     def _purge_files(self, target_contexts: List[str] = None) -> None:
         """Internal method to remove all files storing personalized contexts."""
-        with self._personalization_mutex:
-            if target_contexts:
-                for ctx_path in target_contexts:
-                    personal_context = self.get_personalizations(ctx_path)
-                    path = personal_context.get_source_file_path()
-                    sub_path = os.path.relpath(path, actions.path.talon_user())
-                    # personal_path is a Path
-                    personal_path = self.personal_folder_path / sub_path
-
-                    try:
-                        os.remove(personal_path)
-                    except FileNotFoundError:
-                        pass
-            else:
-                if os.path.exists(self.personal_folder_path):
-                    rmtree(self.personal_folder_path)
+        # callers already hold the personalization mutex
+        if target_contexts:
+            for ctx_path in target_contexts:
+                personal_context = self.get_personalizations(ctx_path)
+                path = personal_context.get_source_file_path()
+                sub_path = os.path.relpath(path, actions.path.talon_user())
+                self._pending_purges.add(str(self.personal_folder_path / sub_path))
+
+            # during a batch, the files stay put in case they are generated again
+            if not self._batch_depth:
+                self._flush_purges()
+        else:
+            # everything goes, including anything waiting to be purged
+            self._pending_purges.clear()
+            self._generated_digests.clear()
+            self._ensured_folders.clear()
+            if os.path.exists(self.personal_folder_path):
+                rmtree(self.personal_folder_path)
+
+    def _flush_purges(self) -> None:
+        """Internal method to remove generated files which are pending removal."""
+        pending_purges = self._pending_purges
+        self._pending_purges = set()
+
+        # group the files by folder, so each folder is listed once and we only remove files
+        # that actually exist.
+        targets_by_folder = defaultdict(set)
+        for file_path in pending_purges:
+            self._generated_digests.pop(file_path, None)
+            folder, file_name = os.path.split(file_path)
+            targets_by_folder[folder].add(file_name)
+
+        for folder, file_names in targets_by_folder.items():
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name in file_names:
+                            os.unlink(entry.path)
+            except FileNotFoundError:
+                # nothing has been generated in this folder
+                pass
 
     def get_source_file_paths(self, context_path: str) -> List[str]:
             """Function for extracting filesystem path information from the context path string."""
@@ -1160,6 +1575,12 @@ class Personalizer():
             return user_paths
             
     def is_talon_file_context(self, context_path) -> bool:
+        personal_context = self._personalizations.get(context_path)
+        if personal_context is not None:
+            # this was settled when the context was loaded (see get_personalizations), no need to
+            # look at the file system again
+            return isinstance(personal_context, self.PersonalCommandContext)
+
         paths = self.get_source_file_paths(context_path)
         if len(paths) > 1:
             # not ready right now to figure out what the right action is for this case, punt for now.
@@ -1189,15 +1610,17 @@ class Personalizer():
         """Return the personalized file path for the given context"""
         personal_context = self.get_personalizations(context_path)
         source_path = personal_context.get_source_file_path()
-        rel_path = Path(source_path).relative_to(os.path.realpath(actions.path.talon_user()))
+        rel_path = Path(source_path).relative_to(self._real_talon_user)
         path = self.personal_folder_path / rel_path
 
         if self.testing:
-            logging.debug(f'Personalizer.get_personal_file_path: {context_path=}, {source_path=}, {rel_path=} {path=}')
+            logging.debug('Personalizer.get_personal_file_path: context_path=%r, source_path=%r, rel_path=%r path=%r', context_path, source_path, rel_path, path)
 
-        dir_path = Path(path).parents[0]
-        if not os.path.exists(dir_path):
+        # contexts from the same source folder share an output folder, so only check each one once
+        dir_path = str(path.parent)
+        if not dir_path in self._ensured_folders:
             makedirs(dir_path, mode=0o755, exist_ok=True)
+            self._ensured_folders.add(dir_path)
             
         return str(path)
 
@@ -1211,9 +1634,48 @@ class Personalizer():
         """Internal wrapper method to set a file watch."""
         
         # follow symlinks before watching/unwatching
-        path = os.path.realpath(path_in)
+        path = _realpath(path_in)
         
-        watched_paths = self._get_watched_paths_for_method(method_ref)
+        self._pending_watches[(method_ref, path)] = True
+        if not self._batch_depth:
+            self._flush_watches()
+
+    def _unwatch(self, path_in: str, method_ref: Callable) -> None:
+        """Internal wrapper method to clear (unset) a file watch."""
+        
+        # follow symlinks before watching/unwatching
+        path = _realpath(path_in)
+        
+        self._pending_watches[(method_ref, path)] = False
+        if not self._batch_depth:
+            self._flush_watches()
+
+    @contextmanager
+    def _batched_updates(self) -> Iterator[None]:
+        """Internal context manager to hold back file watch changes and generated file removals until the outermost batch is done."""
+        with self._personalization_mutex:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._flush_watches()
+                    self._flush_purges()
+
+    def _flush_watches(self) -> None:
+        """Internal method to pass the net watch changes on to Talon."""
+        pending_watches = self._pending_watches
+        self._pending_watches = {}
+        for (method_ref, path), watch in pending_watches.items():
+            if watch:
+                self._fs_watch(path, method_ref)
+            else:
+                self._fs_unwatch(path, method_ref)
+
+    def _fs_watch(self, path: str, method_ref: Callable) -> None:
+        """Internal method to set a file watch, unless it is already set."""
+        watched_paths = self._watched_paths[method_ref]
         if path not in watched_paths:
             # if self.testing:
             #     short_path = self._get_short_path(path)
@@ -1221,41 +1683,40 @@ class Personalizer():
             #     method_name = str(method_ref)
             #     if hasattr(method_ref, '__name__'):
             #         method_name = method_ref.__name__
-            #     logging.debug(f'Personalizer._watch: {method_name}, {short_path}')
+            #     logging.debug(f'Personalizer._fs_watch: {method_name}, {short_path}')
 
-            mtime = None
-            try:
-                mtime = os.stat(path).st_mtime
-            except FileNotFoundError as e:
-                mtime = 0
+            mtime, size = self._get_file_stamp(path)
                 
             # if self.testing:
-            #     logging.debug(f'Personalizer._watch: current timestamp for path {path} - {mtime}')
+            #     logging.debug(f'Personalizer._fs_watch: current timestamp for path {path} - {mtime}')
 
-            self._updated_paths[path] = mtime
+            # the digest lets _is_modified() recognize events which only touch the file. directories
+            # and missing files have none.
+            self._record_mtime(path, mtime, size, self._get_file_digest(path) if mtime else None)
             
             fs.watch(path, method_ref)
+            watched_paths.add(path)
 
-    def _unwatch(self, path_in: str, method_ref: Callable) -> None:
-        """Internal wrapper method to clear (unset) a file watch."""
-        
-        # follow symlinks before watching/unwatching
-        path = os.path.realpath(path_in)
-        
-        # if self.testing:
-        #     short_path = self._get_short_path(path)
-        #
-        #     method_name = str(method_ref)
-        #     if hasattr(method_ref, '__name__'):
-        #         method_name = method_ref.__name__
-        #
-        #     logging.debug(f'Personalizer._unwatch: {method_name}, {short_path}')
+    def _fs_unwatch(self, path: str, method_ref: Callable) -> None:
+        """Internal method to clear a file watch, if it is set."""
+        watched_paths = self._watched_paths[method_ref]
+        if path in watched_paths:
+            # if self.testing:
+            #     short_path = self._get_short_path(path)
+            #
+            #     method_name = str(method_ref)
+            #     if hasattr(method_ref, '__name__'):
+            #         method_name = method_ref.__name__
+            #
+            #     logging.debug(f'Personalizer._fs_unwatch: {method_name}, {short_path}')
 
-        try:
-            fs.unwatch(path, method_ref)
-        except FileNotFoundError:
-            # if a file disappears before we can unwatch it, we don't really care
-            pass
+            try:
+                fs.unwatch(path, method_ref)
+            except FileNotFoundError:
+                # if a file disappears before we can unwatch it, we don't really care
+                pass
+
+            watched_paths.discard(path)
 
     def _unwatch_all(self, method_ref: Callable) -> None:
         """Internal method to stop watching all watched files associated with given method reference."""
@@ -1263,96 +1724,200 @@ class Personalizer():
         watched_paths = self._get_watched_paths_for_method(method_ref)
         for p in watched_paths:
             if self.testing:
-                logging.debug(f'Personalizer._unwatch_all: unwatching {p}')
+                logging.debug('Personalizer._unwatch_all: unwatching %s', p)
             self._unwatch(p, method_ref)
 
     def _get_watched_paths_for_method(self, method: Callable) -> List[str]:
         """Internal method returning list of watched paths associated with given callback method."""
-        path_to_callback_map = dict({k: v[0][0] for k,v in fs.tree.walk()})
-        paths = [k for k,v in path_to_callback_map.items() if v == method]
-        return paths
+        watched_paths = set(self._watched_paths.get(method, ()))
+
+        # include changes which are still held back by a batch
+        for (method_ref, path), watch in self._pending_watches.items():
+            if method_ref == method:
+                if watch:
+                    watched_paths.add(path)
+                else:
+                    watched_paths.discard(path)
+
+        return list(watched_paths)
 
     def _monitor_config_dir(self, path: str, flags: Any) -> None:
         """Callback method for responding to config folder re-creation after deletion."""
         
         if self.testing:
-            logging.debug(f'Personalizer._monitor_config_dir: starting - {path, flags}')
+            logging.debug('Personalizer._monitor_config_dir: starting - %s', (path, flags))
 
-        real_personal_config_folder = os.path.realpath(self.personal_config_folder)
-        if Path(path) == real_personal_config_folder and flags.exists:
+        if path == self._real_personal_config_folder and flags.exists:
             # config folder has reappeared, stop watching the parent folder and begin
             # watching the config folder again.
             self._unwatch(self.personal_config_folder_parent, self._monitor_config_dir)
             self._watch(self.personal_config_folder, self._update_config)
 
     def _update_config(self, path: str, flags: Any) -> None:
-        """Callback method for updating personalized contexts after changes to personalization configuration files."""
-            
-        if self.testing:
-            logging.debug(f'Personalizer._update_config: starting - {path, flags}')
+        """Callback method for changes to personalization configuration files."""
+        if not self._enabled:
+            # late notification after the feature was disabled
+            return
+        self._queue_event(self._process_config_updates, path, flags)
 
-        modified = self._is_modified(path)
-        # WIP - uncomment to reload as many times as Talon tells us to, regardless of whether
-        # WIP - the file is actually modified or not.
-        # modified = True or self._is_modified(path)
-        if not modified:
+    def _update_personalizations(self, path: str, flags: Any) -> None:
+        """Callback method for changes to source files associated with personalized contexts."""
+        if not self._enabled:
+            # late notification after the feature was disabled
             return
+        self._queue_event(self._process_source_updates, path, flags)
 
-        if not flags.exists:
-            if self.testing:
-                logging.debug(f'Personalizer._update_config: cleaning up old config')
+    def _queue_event(self, handler: Callable, path: str, flags: Any) -> None:
+        """Internal method to hold a file system event until the current burst of events is over."""
+        with self._personalization_mutex:
+            # a later event for the same path supersedes an earlier one
+            self._pending_events.setdefault(handler, {})[path] = flags
+
+            # (re)start the timer, so that the events are processed once things settle down
+            now = time.monotonic()
+            if self._pending_events_job:
+                if now - self._pending_events_since >= update_max_delay:
+                    # waited long enough, let the current timer run out
+                    return
+                cron.cancel(self._pending_events_job)
+            else:
+                self._pending_events_since = now
+            self._pending_events_job = cron.after(update_delay, self._process_pending_events)
+
+    def _process_pending_events(self) -> None:
+        """Internal method to process queued file system events."""
+        with self._batched_updates():
+            pending_events = self._pending_events
+            self._pending_events = {}
+            self._pending_events_job = None
+
+            if not self._enabled:
+                # the feature was disabled while these were waiting
+                return
 
-            # stop watching files after they've been deleted
-            self._unwatch(path, self._update_config)
-            
-            real_personal_config_folder = os.path.realpath(self.personal_config_folder)            
-            if Path(path) == real_personal_config_folder:
-                # wait for config folder to reappear
-                self._watch(self.personal_config_folder_parent, self._monitor_config_dir)
-            
-        if len(Path(path).suffix) == 0:
-            # ignore directory change notifications
+            # each handler gets all of its events at once, so it can combine the work they require
+            for handler, events in pending_events.items():
+                try:
+                    handler(events)
+                except Exception:
+                    # don't let one kind of update take the others down with it
+                    logging.exception('Personalizer._process_pending_events: failed to process %d event(s) with %s', len(events), handler.__name__)
+
+    def _process_config_updates(self, events: Dict[str, Any]) -> None:
+        """Update personalized contexts after changes to personalization configuration files."""
+
+        list_paths = set()
+        command_paths = set()
+        stamps = self._get_file_stamps(events)
+        for path, flags in events.items():
             if self.testing:
-                logging.debug(f'Personalizer._update_config: path is a directory, skip it.')
+                logging.debug('Personalizer._process_config_updates: starting - %s', (path, flags))
+
+            modified = self._is_modified(path, stamps.get(path))
+            # WIP - uncomment to reload as many times as Talon tells us to, regardless of whether
+            # WIP - the file is actually modified or not.
+            # modified = True or self._is_modified(path)
+            if not modified:
+                if self.testing:
+                    logging.debug('Personalizer._process_config_updates: path is not modified, skip it.')
+                continue
+
+            if not flags.exists:
+                if self.testing:
+                    logging.debug('Personalizer._process_config_updates: cleaning up old config')
+
+                # stop watching files after they've been deleted
+                self._unwatch(path, self._update_config)
+
+                # whatever takes the place of this path may resolve differently
+                _realpath.cache_clear()
+                
+                if path == self._real_personal_config_folder:
+                    # wait for config folder to reappear
+                    self._watch(self.personal_config_folder_parent, self._monitor_config_dir)
+                
+            if len(Path(path).suffix) == 0:
+                # ignore directory change notifications
+                if self.testing:
+                    logging.debug('Personalizer._process_config_updates: path is a directory, skip it.')
+                continue
+
+            real_path = _realpath(path)
+            kind = None
+            if os.path.splitext(real_path)[1] == '.csv':
+                # config files normally sit right in their sub folder, so look that up first
+                kind = self._config_kinds_by_folder.get(os.path.dirname(real_path))
+                if kind is None:
+                    # ...but they may be further down
+                    if self._is_list_config_file(path):
+                        kind = 'list'
+                    elif self._is_command_config_file(path):
+                        kind = 'command'
+
+            if kind == 'list':
+                list_paths.add(real_path)
+            elif kind == 'command':
+                command_paths.add(real_path)
+            elif self.testing:
+                # e.g. editor swap files
+                logging.debug('Personalizer._process_config_updates: not a config file, skip it - %s', path)
+
+        if not (list_paths or command_paths):
             return
 
-        # when a config file changes, we can't know what contexts need to be loaded/unloaded without
-        # reading the config files again...so, we just reload.
+        # reload once per kind, however many files of that kind were changed.
         updated_contexts = set()
-        if modified:
-            if self._is_list_config_file(path):
-                self.unload_list_personalizations()
-                self.load_list_personalizations(updated_contexts=updated_contexts)
-            elif self._is_command_config_file(path):
-                self.unload_command_personalizations()
-                self.load_command_personalizations(updated_contexts=updated_contexts)
-            else:
-                raise ValueError(f'_update_config: unrecognized file: {path}')
+        if list_paths:
+            self._reload_config_paths(list_paths, self._list_control_file, self._list_config_file_contexts,
+                self.unload_list_personalizations, self.load_list_personalizations, updated_contexts)
+        if command_paths:
+            self._reload_config_paths(command_paths, self._command_control_file, self._command_config_file_contexts,
+                self.unload_command_personalizations, self.load_command_personalizations, updated_contexts)
 
-            # if self.testing:
-            #     logging.debug(f'Personalizer._update_config: AFTER UPDATE: {updated_contexts=}')
-            #     # logging.debug(f'Personalizer._update_config: AFTER UPDATE: {self._updated_paths[path]=}')
-                
-            self.generate_files(target_contexts=[*updated_contexts])
+        # if self.testing:
+        #     logging.debug(f'Personalizer._process_config_updates: AFTER UPDATE: {updated_contexts=}')
+            
+        self.generate_files(target_contexts=[*updated_contexts])
+
+    def _reload_config_paths(self, paths: Set[str], control_file: str, config_file_contexts: Dict[str, Set[str]],
+            unload_all: Callable, load: Callable, updated_contexts: Set[str]) -> None:
+        """Internal method to reload the personalizations affected by the given changed config files."""
+        target_contexts = set()
+        control_file = _realpath(control_file)
+        for path in paths:
+            if path == control_file or not path in config_file_contexts:
+                # when the control file changes, we can't know what contexts need to be loaded/unloaded
+                # without reading it again...so, we just reload everything of this kind. same for files
+                # we know nothing about.
+                target_contexts = None
+                break
+            target_contexts.update(config_file_contexts[path])
+
+        if target_contexts is None:
+            unload_all()
+            load(updated_contexts=updated_contexts)
         else:
-            if self.testing:
-                logging.debug(f'Personalizer._update_config: path is not modified, skip it.')
+            # only the contexts fed by the changed files need to be rebuilt
+            self.unload_personalizations(is_matching_ctx=lambda x: x in target_contexts)
+            load(target_contexts=target_contexts, updated_contexts=updated_contexts)
 
-    def _update_personalizations(self, path: str, flags: Any) -> None:
-        """Callback method for updating personalized contexts after changes to associated source files."""
+    def _process_source_updates(self, events: Dict[str, Any]) -> None:
+        """Update personalized contexts after changes to associated source files."""
         
-        if self.testing:
-            logging.debug(f'Personalizer._update_personalizations: starting - {path, flags}')
-            
-        reload = flags.exists
-        if reload:
-            if self._is_modified(path):
-                ctx_path = self._get_context_from_path(path)
-    
+        stamps = self._get_file_stamps(events)
+        for path, flags in events.items():
+            if self.testing:
+                logging.debug('Personalizer._process_source_updates: starting - %s', (path, flags))
+                
+            reload = flags.exists
+            if reload:
+                if self._is_modified(path, stamps.get(path)):
+                    ctx_path = self._get_context_from_path(path)
+        
+                    self.unload_personalizations(target_paths = [path])
+                    self._update_one_personalized_context(ctx_path)
+            else:
                 self.unload_personalizations(target_paths = [path])
-                self._update_one_personalized_context(ctx_path)
-        else:
-            self.unload_personalizations(target_paths = [path])
 
     def _update_context(self, action: str, arg: Any = None) -> None:
         # if self.testing:
@@ -1373,11 +1938,11 @@ class Personalizer():
 
             if ctx_path not in self._configured_contexts:
                 if self.testing:
-                    logging.debug(f'Personalizer._update_context: context not in configuration, skpping: {ctx_path}')
+                    logging.debug('Personalizer._update_context: context not in configuration, skpping: %s', ctx_path)
                 return
 
             if self.testing:
-                logging.debug(f'Personalizer._update_context: {action=}, {arg}')
+                logging.debug('Personalizer._update_context: action=%r, %s', action, arg)
 
             if action == "add_context":
                 self._update_one_personalized_context(ctx_path)
@@ -1389,12 +1954,12 @@ class Personalizer():
     def _update_one_personalized_context(self, ctx_path: str) -> None:
         with self._personalization_mutex:
             if self.testing:
-                logging.debug(f'Personalizer.update_one_personalized_context: considering {ctx_path=}')
+                logging.debug('Personalizer.update_one_personalized_context: considering ctx_path=%r', ctx_path)
 
             # only load contexts which have been configured
             if ctx_path in self._configured_contexts:
                 if self.testing:
-                    logging.debug(f'Personalizer.update_one_personalized_context: {ctx_path=}')
+                    logging.debug('Personalizer.update_one_personalized_context: ctx_path=%r', ctx_path)
                             
                 # WIP - anywhere this check appears is an opportunity to push code down into
                 # PersonalListContext and PersonalCommandContext
@@ -1408,36 +1973,18 @@ class Personalizer():
 
     def _get_short_path(self, path: str) -> str:
         short_path = Path(path)
-        if short_path.is_relative_to(os.path.realpath(self.personal_config_folder)):
+        if short_path.is_relative_to(self._real_personal_config_folder):
             
-            short_path = short_path.relative_to(os.path.realpath(self.personal_config_folder))
+            short_path = short_path.relative_to(self._real_personal_config_folder)
         else:
-            short_path = short_path.relative_to(os.path.realpath(actions.path.talon_user()))
+            short_path = short_path.relative_to(self._real_talon_user)
         
         # return str, not Path
         return str(short_path)
 
     def _get_context_from_path(self, path_in: str) -> str:
         """Returns Talon context path corresponding to given talon user folder path."""
-        path = Path(path_in)
-        if path.is_absolute():
-            if not path.is_relative_to(actions.path.talon_user()):
-                raise ValueError(f'_get_context_from_path: given path is not relative to Talon user folder: {path_in}')
-        else:
-            # assume path is relative to talon user folder
-            path = actions.path.talon_user() / path
-
-        # relpath() accepts Path or str, returns str
-        temp = os.path.relpath(path, actions.path.talon_user())
-
-        extension = path.suffix
-        if not extension == '.talon':
-            # remove the file extension. splitext() returns str
-            temp, _ = os.path.splitext(temp)
-        ctx_path = temp.replace(os.path.sep, '.')
-
-        # this will need to change if we ever want to override any context not under 'user.'.
-        return 'user.' + ctx_path
+        return _context_path_for_file(path_in, self._talon_user)
 
     def _get_personalization_context_path_prefix(self) -> str:
         top_level_relative = os.path.relpath(self.personalization_root_folder_path, actions.path.talon_user())
@@ -1448,61 +1995,45 @@ class Personalizer():
 
     def _is_list_config_file(self, path: str) -> bool:
         """Checks whether given path is under the list personalization config folder."""
-        return self._is_config_file(path, self.personal_list_folder_name)
+        return self._is_config_file(path, self._list_config_prefix)
 
     def _is_command_config_file(self, path: str) -> bool:
         """Checks whether given path is under the command personalization config folder."""
-        return self._is_config_file(path, self.personal_command_folder_name)
+        return self._is_config_file(path, self._command_config_prefix)
     
-    def _is_config_file(self, path: str, category: str) -> bool:
-        """Checks whether given path is under the indicated personalization config folder."""
-        # logging.debug(f'Personalizer._is_config_file: starting - {path, category}')
+    def _is_config_file(self, path: str, folder_prefix: str) -> bool:
+        """Checks whether given path is under the personalization config folder with the given real path prefix."""
+        # logging.debug(f'Personalizer._is_config_file: starting - {path, folder_prefix}')
+
+        # plain string comparison, no file system access beyond the cached realpath
+        if not _realpath(path).startswith(folder_prefix):
+            return False
 
         # is_file() does not work if the file does not exist (i.e. has been deleted)
         # is_file = Path(path).is_file()
         #
-        # just look for a suffix - doesn't work on files with no suffix.
-        is_file = len(Path(path).suffix) != 0
-
-        is_config = (category == 'control' or category == self._get_config_category(path))
-        
-        result = is_file and is_config
+        # just look at the suffix. only CSV files are loaded (see _get_lines_from_csv), so changes to
+        # anything else, e.g. editor swap files, are no reason to reload.
+        result = os.path.splitext(path)[1] == '.csv'
         
         # if self.testing:
-        #     logging.debug(f'Personalizer._is_config_file: returning {is_file=}, {is_config=}, {result=}')
+        #     logging.debug(f'Personalizer._is_config_file: returning {result=}')
         
         return result
-    
-    def _get_config_category(self, path: str) -> str:
-        """Return parent directory name of given path relative to the personalization configuration folder, e.g. list_personalization"""
-        realpath = os.path.realpath(path)
-        personal_config_folder = os.path.realpath(self.personal_config_folder)
-        
-        temp = os.path.relpath(realpath, personal_config_folder)
-        temp = temp.split(os.path.sep)
-
-        category = None
-        if temp[0] == self.personal_list_folder_name or temp[0] == self.personal_command_folder_name:
-            category = temp[0]
-        elif temp[0] == self.control_file_name:
-            category = 'control'
-            
-        # logging.debug(f'Personalizer._get_config_category: returning {category}')
-        return category
 
-    def _is_modified(self, path: str) -> bool:
-        mtime = None
-        try:
-            mtime = os.stat(path).st_mtime
-        except FileNotFoundError as e:
-            mtime = 0
+    def _is_modified(self, path: str, stamp: Tuple[int, int] = None) -> bool:
+        # the caller may already have the (mtime, size) of the path, see _get_file_stamps()
+        mtime, size = stamp or self._get_file_stamp(path)
 
         # if self.testing:
         #     logging.debug(f'Personalizer._is_modified: current timestamp: {mtime}')
 
-        if path in self._updated_paths:
+        digest = None
+        key = _path_key(path)
+        known = self._updated_paths.get(key)
+        if known:
             # if self.testing:
-            #     logging.debug(f'Personalizer._is_modified: path is known with timestamp {self._updated_paths[path]}.')
+            #     logging.debug(f'Personalizer._is_modified: path is known with timestamp {known[0]}.')
                 
             # WIP - sometimes the file timestamp changes between one invocation of this method and the next, even
             # WIP - though the file has not actually been changed. not sure why this is happening. An example -
@@ -1535,20 +2066,89 @@ class Personalizer():
             # WIP - 2022-05-05 11:45:06 DEBUG _update_config: path is not modified, skip it.
             # WIP - 2022-05-05 11:45:06 DEBUG [~] C:\Users\xxx\AppData\Roaming\talon\user\personalization\_personalizations\knausj_talon\misc\testfile.talon
             #
-            if self._updated_paths[path] == mtime:
+            known_mtime, known_size, known_digest = known
+            if known_mtime == mtime and known_size == size:
+                # both must match. on file systems with coarse timestamps, a quick edit may not
+                # move the timestamp at all.
+                self._updated_paths.move_to_end(key)
                 return False
-            else:
-                # if self.testing:
-                #     logging.debug(f'Personalizer._is_modified: path is modified, update mtime.')
-                pass
-        else:
-            # if self.testing:
-            #     logging.debug(f'Personalizer._is_modified: path is NOT known, record mtime.')
-            pass
+            elif mtime and known_size == size:
+                # the timestamp moved but the size did not (see above), so compare the contents
+                # before deciding.
+                digest = self._get_file_digest(path)
+                if digest and digest == known_digest:
+                    # if self.testing:
+                    #     logging.debug(f'Personalizer._is_modified: path is touched but not modified, update mtime.')
+                    self._record_mtime(path, mtime, size, digest)
+                    return False
+            # else:
+            #     if self.testing:
+            #         logging.debug(f'Personalizer._is_modified: path is modified, update mtime.')
+        # else:
+        #     if self.testing:
+        #         logging.debug(f'Personalizer._is_modified: path is NOT known, record mtime.')
 
-        self._updated_paths[path] = mtime
+        if mtime and digest is None:
+            # remember the contents too, so the next event which only touches the file is recognized
+            digest = self._get_file_digest(path)
+        self._record_mtime(path, mtime, size, digest)
 
         return True
+
+    def _get_file_stamp(self, path: str) -> Tuple[int, int]:
+        """Internal method to return the modification time and size of a path, or zeros if it does not exist."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError as e:
+            return 0, 0
+        # integer nanoseconds compare exactly, unlike the float st_mtime
+        return st.st_mtime_ns, st.st_size
+
+    def _get_file_stamps(self, paths: Iterator[str]) -> Dict[str, Tuple[int, int]]:
+        """Internal method to return the modification time and size of several paths, listing each folder
+        just once where several of the paths share it. Paths not covered this way are left out."""
+        names_by_folder = defaultdict(set)
+        for path in paths:
+            names_by_folder[os.path.dirname(path)].add(os.path.basename(path))
+
+        stamps = {}
+        for folder, names in names_by_folder.items():
+            if len(names) < 2:
+                # a single stat() is cheaper than listing the folder
+                continue
+            folder_stamps = dict.fromkeys((os.path.join(folder, name) for name in names), (0, 0))
+            try:
+                # on Windows, the entries come with their stat information, so this saves a system call per path
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            st = entry.stat()
+                            folder_stamps[entry.path] = (st.st_mtime_ns, st.st_size)
+            except OSError as e:
+                # leave these to _is_modified()
+                continue
+            stamps.update(folder_stamps)
+
+        return stamps
+
+    def _get_file_digest(self, path: str) -> str:
+        """Internal method to return a digest of the contents of a file, or None if it cannot be read."""
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except OSError as e:
+            return None
+
+    def _record_mtime(self, path: str, mtime: int, size: int = 0, digest: str = None) -> None:
+        """Internal method to remember the modification time of a path, forgetting the least recently used paths beyond the limit."""
+        key = _path_key(path)
+        self._updated_paths[key] = (mtime, size, digest)
+        self._updated_paths.move_to_end(key)
+        # never drop below twice the number of watched paths, otherwise watched files would be forgotten
+        # and reloaded for nothing on their next event.
+        limit = max(updated_paths_limit, 2 * sum(len(paths) for paths in self._watched_paths.values()))
+        while len(self._updated_paths) > limit:
+            self._updated_paths.popitem(last=False)
             
     # def _update_decls(self, decls) -> None:
     #     l = getattr(decls, 'lists')
@@ -1570,7 +2170,10 @@ def on_ready() -> None:
 
     personalizer = Personalizer(mod, ctx, personalizer_settings, personalization_tag_name, personalization_tag)
 
-    personalizer.startup()
+    # loading reads and writes quite a few files, so do that after Talon has finished getting
+    # ready instead of holding it up. the personalization mutex takes care of any events which
+    # arrive in the meantime.
+    cron.after('50ms', personalizer.startup)
 
 personalizer = None
 